@@ -1,5 +1,122 @@
+import argparse
 import random
+import sys
+from array import array
+from collections import namedtuple
 from datetime import datetime
+from enum import IntEnum
+from functools import lru_cache
+
+
+ORE_LAVORATIVE_GIORNO = 8  # ore lavorative in una giornata
+
+# Separatori e intestazioni grafiche dell'output, costruiti una sola volta
+_SEP_UGUALE = "=" * 60
+_SEP_TRATTINO = "─" * 60
+_SEP_SPUNTA = "✓" * 60
+_BANNER_MUCCA = "🐄" * 30
+_BANNER_GRAFICO = "📊" * 30
+
+_TempiProduzione = namedtuple(
+    '_TempiProduzione',
+    ['tempo_lavorazione_ore', 'tempo_lavorazione_giorni', 'giorni_effettivi', 'tempo_totale_ore']
+)
+
+# Risultato di produzione di un singolo prodotto
+RisultatoProduzione = namedtuple(
+    'RisultatoProduzione',
+    ['prodotto', 'quantita', *_TempiProduzione._fields]
+)
+
+
+class ProdottoID(IntEnum):
+    """
+    Identificativi interi dei prodotti, usati come indice diretto nelle
+    colonne del catalogo al posto del codice testuale.
+    """
+    CARNE_BOVINA = 0
+    CARNE_SUINA = 1
+    SALUMI = 2
+    FORMAGGI = 3
+
+
+def _tempi(tempo_per_unita: float, capacita_giornaliera: float, quantita: float) -> _TempiProduzione:
+    """
+    Calcolo puro dei tempi di produzione di un singolo prodotto.
+
+    Args:
+        tempo_per_unita (float): Ore di lavorazione per kg
+        capacita_giornaliera (float): Capacità massima in kg al giorno
+        quantita (float): Quantità da produrre
+
+    Returns:
+        _TempiProduzione: Ore di lavorazione, giorni necessari ed effettivi, ore totali
+    """
+    # Calcolo giorni necessari considerando la capacità giornaliera
+    giorni_necessari = quantita / capacita_giornaliera
+
+    # Tempo effettivo di lavorazione (ore)
+    tempo_lavorazione = quantita * tempo_per_unita
+
+    # Se la produzione supera la capacità giornaliera, si distribuisce su più giorni
+    # (divisione intera arrotondata per eccesso, almeno un giorno)
+    giorni_effettivi = max(1, int(-(-quantita // capacita_giornaliera)))
+
+    return _TempiProduzione(
+        tempo_lavorazione,
+        giorni_necessari,
+        giorni_effettivi,
+        giorni_effettivi * ORE_LAVORATIVE_GIORNO
+    )
+
+
+@lru_cache(maxsize=1024)
+def _calcola_tempi(tempo_per_unita, capacita_giornaliera, quantita):
+    """
+    Versione memorizzata di _tempi per il calcolo puntuale: la configurazione
+    fa parte della chiave, quindi modificare tempi o capacità non restituisce
+    mai risultati obsoleti.
+    """
+    return _tempi(tempo_per_unita, capacita_giornaliera, quantita)
+
+
+def _tempi_batch(quantita, tempo_per_kg, capacita, calcolo=_tempi):
+    """
+    Applica il calcolo dei tempi a sequenze allineate di quantità e parametri.
+    Per default usa _tempi senza cache (con molti scenari casuali le chiavi
+    raramente si ripetono); le simulazioni ripetute sugli stessi dati possono
+    passare _calcola_tempi.
+
+    Args:
+        quantita (list): Quantità da produrre
+        tempo_per_kg (list): Ore di lavorazione per kg
+        capacita (list): Capacità massima in kg al giorno
+        calcolo (callable): Funzione di calcolo per singolo elemento (default _tempi)
+
+    Returns:
+        list: Un _TempiProduzione per ciascun elemento
+    """
+    return [calcolo(t, c, q) for q, t, c in zip(quantita, tempo_per_kg, capacita)]
+
+
+def _estrai_quantita(k, min_qty, max_qty):
+    """
+    Estrae k quantità intere uniformi in [min_qty, max_qty].
+
+    Args:
+        k (int): Numero di quantità da estrarre
+        min_qty (int): Quantità minima
+        max_qty (int): Quantità massima
+
+    Returns:
+        list: Quantità estratte
+
+    Raises:
+        ValueError: Se min_qty è maggiore di max_qty
+    """
+    if min_qty > max_qty:
+        raise ValueError(f"Intervallo di quantità vuoto: min_qty={min_qty} > max_qty={max_qty}")
+    return random.choices(range(min_qty, max_qty + 1), k=k)
 
 
 class SimulatoreProduzioneZioPeppe:
@@ -9,6 +126,14 @@ class SimulatoreProduzioneZioPeppe:
     di carni, salumi e formaggi.
     """
 
+    # Modello di stampa dei dettagli di un prodotto (campi di RisultatoProduzione)
+    _FMT_PRODOTTO = (
+        "\n{prodotto}:\n"
+        "  • Quantità: {quantita} kg\n"
+        "  • Tempo lavorazione: {tempo_lavorazione_ore:.2f} ore\n"
+        "  • Giorni necessari: {giorni_effettivi} giorni"
+    )
+
     def __init__(self):
         """
         Inizializza il simulatore con le configurazioni di default per i vari
@@ -51,41 +176,94 @@ class SimulatoreProduzioneZioPeppe:
         # Quantità da produrre (inizialmente vuote, generate casualmente)
         self.quantita_produzione = {}
 
-    def genera_quantita_casuali(self, min_qty=50, max_qty=300):
+        self._sincronizza_catalogo()
+
+    def _sincronizza_catalogo(self):
+        """
+        Ricostruisce da self.prodotti le colonne del catalogo in forma "struct of
+        arrays" (nell'ordine del dizionario, indicizzate tramite self._idx per codice
+        prodotto o ProdottoID). self.prodotti resta l'unica fonte dei dati: ogni
+        calcolo chiama questo metodo prima di leggere le colonne, così prodotti
+        aggiunti o modificati direttamente nel dizionario vengono sempre considerati.
+
+        Raises:
+            ValueError: Se i primi prodotti del catalogo non corrispondono, in
+                ordine, ai membri di ProdottoID
+        """
+        self._codici = list(self.prodotti)
+        if self._codici[:len(ProdottoID)] != [pid.name.lower() for pid in ProdottoID]:
+            raise ValueError("ProdottoID non è allineato al catalogo prodotti")
+        self._idx = {c: i for i, c in enumerate(self._codici)}
+        self._idx.update({pid: pid for pid in ProdottoID})
+        self._nomi = [self.prodotti[c]['nome'] for c in self._codici]
+        self._tempo_per_kg = array('d', (self.prodotti[c]['tempo_per_kg'] for c in self._codici))
+        self._capacita = array('d', (self.prodotti[c]['capacita_giornaliera'] for c in self._codici))
+
+    def genera_quantita_casuali(self, min_qty=50, max_qty=300, silent=False):
         """
         Genera casualmente le quantità da produrre per ogni tipo di prodotto.
 
         Args:
             min_qty (int): Quantità minima da produrre (default 50 kg)
             max_qty (int): Quantità massima da produrre (default 300 kg)
+            silent (bool): Se True non stampa nulla (utile per simulazioni ripetute)
 
         Returns:
             dict: Dizionario con le quantità generate per ogni prodotto
-        """
-        print("=" * 60)
-        print("GENERAZIONE QUANTITÀ DI PRODUZIONE")
-        print("=" * 60)
 
-        for codice_prodotto, info in self.prodotti.items():
-            quantita = random.randint(min_qty, max_qty)
-            self.quantita_produzione[codice_prodotto] = quantita
-            print(f"• {info['nome']}: {quantita} {info['unita_misura']}")
+        Raises:
+            ValueError: Se min_qty è maggiore di max_qty
+        """
+        # Estrazione per tutti i prodotti del catalogo in una sola chiamata
+        self._sincronizza_catalogo()
+        quantita = _estrai_quantita(len(self._codici), min_qty, max_qty)
+        self.quantita_produzione = dict(zip(self._codici, quantita))
+
+        if not silent:
+            righe = [_SEP_UGUALE, "GENERAZIONE QUANTITÀ DI PRODUZIONE", _SEP_UGUALE]
+            for codice_prodotto, qty in zip(self._codici, quantita):
+                info = self.prodotti[codice_prodotto]
+                righe.append(f"• {info['nome']}: {qty} {info['unita_misura']}")
+            righe.append("")
+            sys.stdout.write("\n".join(righe) + "\n")
 
-        print()
         return self.quantita_produzione
 
+    def genera_quantita_casuali_batch(self, n_runs, min_qty=50, max_qty=300):
+        """
+        Genera le quantità da produrre per più scenari in un colpo solo,
+        senza modificare le quantità correnti del simulatore.
+
+        Args:
+            n_runs (int): Numero di scenari da generare
+            min_qty (int): Quantità minima da produrre (default 50 kg)
+            max_qty (int): Quantità massima da produrre (default 300 kg)
+
+        Returns:
+            list: Matrice n_runs x n_prodotti (righe allineate a self._codici)
+
+        Raises:
+            ValueError: Se min_qty è maggiore di max_qty
+        """
+        self._sincronizza_catalogo()
+        n_prodotti = len(self._codici)
+        valori = _estrai_quantita(n_runs * n_prodotti, min_qty, max_qty)
+        return [valori[i:i + n_prodotti] for i in range(0, n_runs * n_prodotti, n_prodotti)]
+
     def configura_tempo_produzione(self, prodotto, tempo_per_unita):
         """
         Configura il tempo di produzione per unità di un prodotto specifico.
 
         Args:
-            prodotto (str): Codice del prodotto da configurare
+            prodotto (str | ProdottoID): Codice o identificativo del prodotto da configurare
             tempo_per_unita (float): Tempo in ore per unità di prodotto
         """
-        if prodotto in self.prodotti:
-            self.prodotti[prodotto]['tempo_per_kg'] = tempo_per_unita
-            print(f"✓ Tempo di produzione per {self.prodotti[prodotto]['nome']} "
-                  f"aggiornato a {tempo_per_unita} ore/{self.prodotti[prodotto]['unita_misura']}")
+        self._sincronizza_catalogo()
+        if prodotto in self._idx:
+            info = self.prodotti[self._codici[self._idx[prodotto]]]
+            info['tempo_per_kg'] = tempo_per_unita
+            print(f"✓ Tempo di produzione per {info['nome']} "
+                  f"aggiornato a {tempo_per_unita} ore/{info['unita_misura']}")
         else:
             print(f"✗ Prodotto '{prodotto}' non trovato")
 
@@ -94,13 +272,15 @@ class SimulatoreProduzioneZioPeppe:
         Configura la capacità produttiva massima giornaliera per un prodotto.
 
         Args:
-            prodotto (str): Codice del prodotto da configurare
-            capacita (int): Capacità massima in kg al giorno
+            prodotto (str | ProdottoID): Codice o identificativo del prodotto da configurare
+            capacita (float): Capacità massima in kg al giorno
         """
-        if prodotto in self.prodotti:
-            self.prodotti[prodotto]['capacita_giornaliera'] = capacita
-            print(f"✓ Capacità giornaliera per {self.prodotti[prodotto]['nome']} "
-                  f"aggiornata a {capacita} {self.prodotti[prodotto]['unita_misura']}/giorno")
+        self._sincronizza_catalogo()
+        if prodotto in self._idx:
+            info = self.prodotti[self._codici[self._idx[prodotto]]]
+            info['capacita_giornaliera'] = capacita
+            print(f"✓ Capacità giornaliera per {info['nome']} "
+                  f"aggiornata a {capacita} {info['unita_misura']}/giorno")
         else:
             print(f"✗ Prodotto '{prodotto}' non trovato")
 
@@ -121,201 +301,272 @@ class SimulatoreProduzioneZioPeppe:
         considerando i vincoli di capacità giornaliera.
 
         Args:
-            prodotto (str): Codice del prodotto
+            prodotto (str | ProdottoID): Codice o identificativo del prodotto
             quantita (float): Quantità da produrre
 
         Returns:
-            dict: Dizionario con tempi di produzione e informazioni dettagliate
+            RisultatoProduzione: Tempi di produzione e informazioni dettagliate
         """
-        info_prodotto = self.prodotti[prodotto]
-        tempo_per_unita = info_prodotto['tempo_per_kg']
-        capacita_giornaliera = info_prodotto['capacita_giornaliera']
-
-        # Calcolo giorni necessari considerando la capacità giornaliera
-        giorni_necessari = quantita / capacita_giornaliera
-
-        # Tempo effettivo di lavorazione (ore)
-        tempo_lavorazione = quantita * tempo_per_unita
-
-        # Se la produzione supera la capacità giornaliera, si distribuisce su più giorni
-        if quantita > capacita_giornaliera:
-            giorni_effettivi = int(quantita / capacita_giornaliera) + (1 if quantita % capacita_giornaliera > 0 else 0)
-        else:
-            giorni_effettivi = 1
-
-        return {
-            'prodotto': info_prodotto['nome'],
-            'quantita': quantita,
-            'tempo_lavorazione_ore': round(tempo_lavorazione, 2),
-            'tempo_lavorazione_giorni': round(giorni_necessari, 2),
-            'giorni_effettivi': giorni_effettivi,
-            'tempo_totale_ore': round(giorni_effettivi * 8, 2)  # 8 ore lavorative al giorno
-        }
+        self._sincronizza_catalogo()
+        i = prodotto if isinstance(prodotto, ProdottoID) else self._idx[prodotto]
+        tempi = _calcola_tempi(self._tempo_per_kg[i], self._capacita[i], quantita)
+        return RisultatoProduzione(self._nomi[i], quantita, *tempi)
 
-    def simula_sequenza_produttiva(self, nome_sequenza):
+    def simula_sequenza_produttiva(self, nome_sequenza, silent=False):
         """
         Simula l'intera sequenza produttiva per un gruppo di prodotti correlati,
         calcolando i tempi complessivi e le informazioni dettagliate.
 
         Args:
             nome_sequenza (str): Nome della sequenza da simulare
+            silent (bool): Se True non stampa nulla (utile per simulazioni ripetute)
 
         Returns:
             dict: Risultati della simulazione con tempi totali
         """
         if nome_sequenza not in self.sequenze:
-            print(f"✗ Sequenza '{nome_sequenza}' non trovata")
+            if not silent:
+                print(f"✗ Sequenza '{nome_sequenza}' non trovata")
             return None
 
-        print("=" * 60)
-        print(f"SIMULAZIONE SEQUENZA: {nome_sequenza.upper().replace('_', ' ')}")
-        print("=" * 60)
-
-        risultati = []
-        tempo_totale_ore = 0
-        tempo_totale_giorni = 0
-
-        for prodotto in self.sequenze[nome_sequenza]:
-            if prodotto not in self.quantita_produzione:
-                print(f"⚠ Quantità non definita per {prodotto}, salto...")
-                continue
-
-            quantita = self.quantita_produzione[prodotto]
-            risultato = self.calcola_tempo_produzione(prodotto, quantita)
-            risultati.append(risultato)
-
-            # Aggiorno i totali
-            tempo_totale_ore += risultato['tempo_lavorazione_ore']
-            tempo_totale_giorni = max(tempo_totale_giorni, risultato['giorni_effettivi'])
-
-            # Stampo i dettagli
-            print(f"\n{risultato['prodotto']}:")
-            print(f"  • Quantità: {risultato['quantita']} kg")
-            print(f"  • Tempo lavorazione: {risultato['tempo_lavorazione_ore']} ore")
-            print(f"  • Giorni necessari: {risultato['giorni_effettivi']} giorni")
-
-        print(f"\n{'─' * 60}")
-        print(f"TOTALE SEQUENZA:")
-        print(f"  • Tempo lavorazione totale: {round(tempo_totale_ore, 2)} ore")
-        print(f"  • Giorni produttivi totali: {tempo_totale_giorni} giorni")
-        print(f"  • Ore medie al giorno: {round(tempo_totale_ore / max(tempo_totale_giorni, 1), 2)} ore/giorno")
-        print()
+        # Colonne della sequenza raccolte dal catalogo e calcolate in un solo passaggio
+        self._sincronizza_catalogo()
+        indici = [self._idx[p] for p in self.sequenze[nome_sequenza] if p in self.quantita_produzione]
+        quantita = [self.quantita_produzione[self._codici[i]] for i in indici]
+        tempi = _tempi_batch(
+            quantita,
+            [self._tempo_per_kg[i] for i in indici],
+            [self._capacita[i] for i in indici],
+            calcolo=_calcola_tempi
+        )
+        risultati = [
+            RisultatoProduzione(self._nomi[i], qty, *t)
+            for i, qty, t in zip(indici, quantita, tempi)
+        ]
+
+        # Totali della sequenza
+        tempo_totale_ore = sum(r.tempo_lavorazione_ore for r in risultati)
+        tempo_totale_giorni = max((r.giorni_effettivi for r in risultati), default=0)
+        ore_medie_giorno = tempo_totale_ore / max(tempo_totale_giorni, 1)
+
+        if not silent:
+            righe = [
+                _SEP_UGUALE,
+                f"SIMULAZIONE SEQUENZA: {nome_sequenza.upper().replace('_', ' ')}",
+                _SEP_UGUALE
+            ]
+            for prodotto in self.sequenze[nome_sequenza]:
+                if prodotto not in self.quantita_produzione:
+                    righe.append(f"⚠ Quantità non definita per {prodotto}, salto...")
+
+            # Dettagli per prodotto
+            for r in risultati:
+                righe.append(self._FMT_PRODOTTO.format_map(r._asdict()))
+
+            righe.append(f"\n{_SEP_TRATTINO}")
+            righe.append("TOTALE SEQUENZA:")
+            righe.append(f"  • Tempo lavorazione totale: {tempo_totale_ore:.2f} ore")
+            righe.append(f"  • Giorni produttivi totali: {tempo_totale_giorni} giorni")
+            righe.append(f"  • Ore medie al giorno: {ore_medie_giorno:.2f} ore/giorno")
+            righe.append("")
+            sys.stdout.write("\n".join(righe) + "\n")
 
         return {
             'sequenza': nome_sequenza,
             'dettagli_prodotti': risultati,
-            'tempo_totale_ore': round(tempo_totale_ore, 2),
+            'tempo_totale_ore': tempo_totale_ore,
             'giorni_totali': tempo_totale_giorni,
-            'ore_medie_giorno': round(tempo_totale_ore / max(tempo_totale_giorni, 1), 2)
+            'ore_medie_giorno': ore_medie_giorno
         }
 
-    def rapporto_produzione_completo(self):
+    def rapporto_produzione_completo(self, silent=False):
         """
         Genera un rapporto completo della produzione simulata per tutti i prodotti,
         includendo entrambe le sequenze produttive e i tempi totali.
 
+        Args:
+            silent (bool): Se True non stampa nulla (utile per simulazioni ripetute)
+
         Returns:
             dict: Rapporto completo con tutti i risultati
         """
-        print("\n" + "=" * 60)
-        print("RAPPORTO PRODUZIONE COMPLETO - MACELLERIA ZIOPEPPE")
-        print("=" * 60)
-        print(f"Data simulazione: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
-        print()
+        data_simulazione = datetime.now().strftime('%d/%m/%Y %H:%M')
+
+        if not silent:
+            sys.stdout.write("\n".join([
+                "\n" + _SEP_UGUALE,
+                "RAPPORTO PRODUZIONE COMPLETO - MACELLERIA ZIOPEPPE",
+                _SEP_UGUALE,
+                f"Data simulazione: {data_simulazione}",
+                ""
+            ]) + "\n")
 
         rapporto = {
-            'data_simulazione': datetime.now().strftime('%d/%m/%Y %H:%M'),
+            'data_simulazione': data_simulazione,
             'quantita_produzione': self.quantita_produzione.copy(),
             'sequenze': {}
         }
 
         # Simulo entrambe le sequenze
         for nome_sequenza in self.sequenze.keys():
-            risultato_sequenza = self.simula_sequenza_produttiva(nome_sequenza)
+            risultato_sequenza = self.simula_sequenza_produttiva(nome_sequenza, silent=silent)
             rapporto['sequenze'][nome_sequenza] = risultato_sequenza
 
-        # Calcolo totali generali
-        tempo_totale_generale = sum(
-            seq['tempo_totale_ore']
-            for seq in rapporto['sequenze'].values()
-            if seq is not None
-        )
-
-        giorni_totali_generale = max(
-            seq['giorni_totali']
-            for seq in rapporto['sequenze'].values()
-            if seq is not None
-        )
+        # Calcolo totali generali (somma e massimo in un unico passaggio)
+        tempo_totale_generale = 0.0
+        giorni_totali_generale = 0
+        for seq in rapporto['sequenze'].values():
+            if seq is None:
+                continue
+            tempo_totale_generale += seq['tempo_totale_ore']
+            if seq['giorni_totali'] > giorni_totali_generale:
+                giorni_totali_generale = seq['giorni_totali']
 
-        print("=" * 60)
-        print("RIEPILOGO GENERALE PRODUZIONE")
-        print("=" * 60)
-        print(f"Tempo lavorazione totale: {round(tempo_totale_generale, 2)} ore")
-        print(f"Giorni produttivi necessari: {giorni_totali_generale} giorni")
-        print(f"Ore medie giornaliere: {round(tempo_totale_generale / max(giorni_totali_generale, 1), 2)} ore/giorno")
+        ore_medie_generale = tempo_totale_generale / max(giorni_totali_generale, 1)
 
         # Quantità totali
         quantita_totale = sum(self.quantita_produzione.values())
-        print(f"Quantità totale prodotta: {quantita_totale} kg")
-        print("=" * 60)
-        print()
+
+        if not silent:
+            sys.stdout.write("\n".join([
+                _SEP_UGUALE,
+                "RIEPILOGO GENERALE PRODUZIONE",
+                _SEP_UGUALE,
+                f"Tempo lavorazione totale: {tempo_totale_generale:.2f} ore",
+                f"Giorni produttivi necessari: {giorni_totali_generale} giorni",
+                f"Ore medie giornaliere: {ore_medie_generale:.2f} ore/giorno",
+                f"Quantità totale prodotta: {quantita_totale} kg",
+                _SEP_UGUALE,
+                ""
+            ]) + "\n")
 
         rapporto['totali_generali'] = {
-            'tempo_totale_ore': round(tempo_totale_generale, 2),
+            'tempo_totale_ore': tempo_totale_generale,
             'giorni_totali': giorni_totali_generale,
-            'ore_medie_giorno': round(tempo_totale_generale / max(giorni_totali_generale, 1), 2),
+            'ore_medie_giorno': ore_medie_generale,
             'quantita_totale_kg': quantita_totale
         }
 
         return rapporto
 
+    def monte_carlo(self, n_paths, min_qty=80, max_qty=250):
+        """
+        Valuta in blocco molti scenari di domanda casuali e restituisce, per
+        ciascuno, i totali generali che rapporto_produzione_completo calcolerebbe
+        con quelle quantità (somma delle ore e massimo dei giorni sui prodotti
+        delle sequenze produttive), senza stampare nulla e senza modificare le
+        quantità correnti del simulatore.
+
+        Args:
+            n_paths (int): Numero di scenari da simulare
+            min_qty (int): Quantità minima da produrre (default 80 kg)
+            max_qty (int): Quantità massima da produrre (default 250 kg)
+
+        Returns:
+            tuple: (ore di lavorazione totali, giorni produttivi necessari),
+                due liste con un valore per scenario
+        """
+        matrice = self.genera_quantita_casuali_batch(n_paths, min_qty, max_qty)
+
+        n_prodotti = len(self._codici)
+
+        # Un unico passaggio del nucleo di calcolo su tutti gli scenari affiancati
+        tempi = _tempi_batch(
+            [q for riga in matrice for q in riga],
+            self._tempo_per_kg * n_paths,
+            self._capacita * n_paths
+        )
+        ore = [t.tempo_lavorazione_ore for t in tempi]
+        giorni = [t.giorni_effettivi for t in tempi]
+
+        # Riduzione sui prodotti delle sequenze, come nel rapporto (un prodotto
+        # presente in più sequenze viene contato una volta per sequenza)
+        posizioni = [
+            self._idx[p]
+            for prodotti_sequenza in self.sequenze.values()
+            for p in prodotti_sequenza
+            if p in self._idx
+        ]
+        righe = range(0, n_paths * n_prodotti, n_prodotti)
+        ore_totali = [sum(ore[r + j] for j in posizioni) for r in righe]
+        giorni_totali = [max((giorni[r + j] for j in posizioni), default=0) for r in righe]
+        return ore_totali, giorni_totali
+
 
 # ============================================================================
 # ESEMPIO DI UTILIZZO DEL SIMULATORE
 # ============================================================================
 
-def main():
+def main(n_runs=1, warmup=False):
     """
     Funzione principale che esegue una simulazione completa del processo
     produttivo dell'azienda "Zio Peppe".
+
+    Args:
+        n_runs (int): Numero di simulazioni da eseguire nello stesso processo
+            (default 1); più esecuzioni consentono a un JIT come PyPy di
+            andare a regime
+        warmup (bool): Se True esegue prima una simulazione silenziosa di
+            riscaldamento, esclusa dall'output (default False)
+
+    Raises:
+        ValueError: Se n_runs è minore di 1
     """
-    print("\n" + "🐄" * 30)
+    if n_runs < 1:
+        raise ValueError(f"Il numero di simulazioni deve essere almeno 1 (ricevuto {n_runs})")
+
+    print("\n" + _BANNER_MUCCA)
     print("SIMULATORE PROCESSO PRODUTTIVO")
     print("MACELLERIA BRACERIA 'ZIO PEPPE'")
-    print("🐄" * 30 + "\n")
+    print(_BANNER_MUCCA + "\n")
 
     # Creo l'istanza del simulatore
     simulatore = SimulatoreProduzioneZioPeppe()
 
-    # Genero quantità casuali di produzione
-    simulatore.genera_quantita_casuali(min_qty=80, max_qty=250)
-
     # Esempio di configurazione personalizzata (opzionale)
-    print("\n" + "─" * 60)
+    print("\n" + _SEP_TRATTINO)
     print("CONFIGURAZIONI PERSONALIZZATE (esempio)")
-    print("─" * 60)
+    print(_SEP_TRATTINO)
     simulatore.configura_tempo_produzione('carne_bovina', 0.18)
     simulatore.configura_capacita_giornaliera('salumi', 220)
     print()
 
-    # Genero il rapporto completo
-    rapporto = simulatore.rapporto_produzione_completo()
+    if warmup:
+        # Esecuzione "a vuoto" per riscaldare il JIT prima delle simulazioni misurate
+        simulatore.genera_quantita_casuali(min_qty=80, max_qty=250, silent=True)
+        simulatore.rapporto_produzione_completo(silent=True)
+
+    for _ in range(n_runs):
+        # Genero quantità casuali di produzione
+        simulatore.genera_quantita_casuali(min_qty=80, max_qty=250)
+
+        # Genero il rapporto completo
+        rapporto = simulatore.rapporto_produzione_completo()
 
-    # Informazioni aggiuntive
-    print("\n" + "📊" * 30)
-    print("ANALISI EFFICIENZA PRODUTTIVA")
-    print("📊" * 30 + "\n")
+        # Informazioni aggiuntive
+        print("\n" + _BANNER_GRAFICO)
+        print("ANALISI EFFICIENZA PRODUTTIVA")
+        print(_BANNER_GRAFICO + "\n")
 
-    for sequenza, dati in rapporto['sequenze'].items():
-        if dati:
-            efficienza = (dati['ore_medie_giorno'] / 8) * 100  # % di utilizzo giornata lavorativa
-            print(f"{sequenza.replace('_', ' ').title()}:")
-            print(f"  Efficienza utilizzo giornata: {round(efficienza, 1)}%")
+        for sequenza, dati in rapporto['sequenze'].items():
+            if dati:
+                efficienza = (dati['ore_medie_giorno'] / ORE_LAVORATIVE_GIORNO) * 100  # % di utilizzo giornata lavorativa
+                print(f"{sequenza.replace('_', ' ').title()}:")
+                print(f"  Efficienza utilizzo giornata: {efficienza:.1f}%")
 
-    print("\n" + "✓" * 60)
+    print("\n" + _SEP_SPUNTA)
     print("SIMULAZIONE COMPLETATA CON SUCCESSO")
-    print("✓" * 60 + "\n")
+    print(_SEP_SPUNTA + "\n")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Simulatore processo produttivo 'Zio Peppe'")
+    parser.add_argument('--runs', type=int, default=1,
+                        help="numero di simulazioni da eseguire nello stesso processo")
+    parser.add_argument('--warmup', action='store_true',
+                        help="esegue una simulazione silenziosa di riscaldamento prima delle altre")
+    args = parser.parse_args()
+    try:
+        main(n_runs=args.runs, warmup=args.warmup)
+    except ValueError as e:
+        parser.error(str(e))